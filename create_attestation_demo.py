@@ -3,14 +3,37 @@
 Demo script to create a proper FDC attestation and show the complete flow
 """
 
+import asyncio
 import requests
 import json
-import time
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # API endpoints
 PROXY_BASE_URL = 'http://localhost:3001/api/blockchain'
 DA_LAYER_API = 'https://ctn2-data-availability.flare.network'
 
+# Shared HTTP session so connections to the proxy and DA layer are reused
+# via keep-alive instead of paying a fresh TCP+TLS handshake per request
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+)
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+
+# Stripped-down pool for the DA polling loop: a bare urllib3 GET skips the
+# per-call Request/hooks/cookies machinery requests layers on top, which is
+# pure overhead when hammering one URL up to 10 times
+_da_http = urllib3.PoolManager(num_pools=4, maxsize=8, retries=False)
+
+def _strip0x(s: str) -> str:
+    """Remove a leading 0x prefix from a hex string if present"""
+    return s[2:] if s[:2] == '0x' else s
+
 def create_attestation():
     """Create an attestation using AddressValidity type"""
     print("🚀 Creating FDC Attestation...")
@@ -29,7 +52,7 @@ def create_attestation():
         print(f"   Endpoint: {PROXY_BASE_URL}/request-attestation")
         print()
         
-        response = requests.post(
+        response = SESSION.post(
             f"{PROXY_BASE_URL}/request-attestation",
             headers={'Content-Type': 'application/json'},
             json=data,
@@ -77,53 +100,72 @@ def create_attestation():
         print("   - node server.js")
         return None
 
-def poll_da_layer(request_id):
-    """Poll DA Layer for attestation result"""
+async def poll_da_layer_async(request_id):
+    """Poll DA Layer for attestation result without blocking the event loop
+
+    The GET itself runs in a worker thread against the bare urllib3
+    _da_http pool and the waits use asyncio.sleep, so several attestations
+    can be polled concurrently with asyncio.gather without stacking their
+    wait times.
+    """
     if not request_id or len(request_id) < 32:
         print("⚠️  Invalid request_id for DA polling")
         return None, None
-    
+
     print(f"\n🔍 Polling DA Layer...")
     print("=" * 60)
-    
+
     # Clean request_id (remove 0x if present)
-    clean_id = request_id[2:] if request_id.startswith('0x') else request_id
-    
+    clean_id = _strip0x(request_id)
+
     url = f"{DA_LAYER_API}/attestations/{clean_id}"
     print(f"📍 URL: {url}")
-    
+
     max_attempts = 10
+    wait_time = 2.0  # Grown 1.5x per miss unless the server hints otherwise
     for attempt in range(1, max_attempts + 1):
         try:
             print(f"   Attempt {attempt}/{max_attempts}...", end=" ")
-            
-            response = requests.get(url, timeout=10)
-            
-            if response.status_code == 200:
-                result = response.json()
+
+            response = await asyncio.to_thread(_da_http.request, 'GET', url, timeout=10.0)
+
+            if response.status == 200:
+                result = json.loads(response.data)
                 print("✅ SUCCESS!")
                 print(f"   Attestation Response: {result.get('attestationResponse')}")
                 print(f"   Proof: {result.get('proof')[:100]}..." if result.get('proof') else "   Proof: None")
-                
+
                 return result.get('attestationResponse'), result.get('proof')
-            
-            elif response.status_code == 404:
+
+            elif response.status == 404:
                 print("📭 Not ready yet")
                 if attempt < max_attempts:
-                    wait_time = min(5 + attempt, 15)  # Progressive backoff
-                    print(f"   Waiting {wait_time} seconds...")
-                    time.sleep(wait_time)
+                    # Honor a server-provided Retry-After hint when present,
+                    # otherwise back off multiplicatively up to 15s
+                    retry_after = response.headers.get('Retry-After')
+                    if retry_after:
+                        try:
+                            wait_time = min(float(retry_after), 15)
+                        except ValueError:
+                            pass
+                    print(f"   Waiting {wait_time:g} seconds...")
+                    await asyncio.sleep(wait_time)
+                    wait_time = min(wait_time * 1.5, 15)
             else:
-                print(f"❌ Error {response.status_code}")
+                print(f"❌ Error {response.status}")
                 return None, None
-                
-        except requests.exceptions.RequestException as e:
+
+        except urllib3.exceptions.HTTPError as e:
             print(f"❌ Error: {str(e)}")
             return None, None
-    
+
     print("\n⏰ Timeout reached - attestation may still be processing")
     return None, None
 
+def poll_da_layer(request_id):
+    """Synchronous wrapper around poll_da_layer_async for single attestations"""
+    return asyncio.run(poll_da_layer_async(request_id))
+
 def verify_attestation(request_id, attestation_response, proof):
     """Verify the attestation on-chain"""
     if not all([request_id, attestation_response, proof]):
@@ -135,9 +177,9 @@ def verify_attestation(request_id, attestation_response, proof):
     
     try:
         # Clean hex values (remove 0x)
-        clean_request_id = request_id[2:] if request_id.startswith('0x') else request_id
-        clean_attestation = attestation_response[2:] if attestation_response.startswith('0x') else attestation_response
-        clean_proof = proof[2:] if proof.startswith('0x') else proof
+        clean_request_id = _strip0x(request_id)
+        clean_attestation = _strip0x(attestation_response)
+        clean_proof = _strip0x(proof)
         
         data = {
             "request_id": clean_request_id,
@@ -145,7 +187,7 @@ def verify_attestation(request_id, attestation_response, proof):
             "proof": clean_proof
         }
         
-        response = requests.post(
+        response = SESSION.post(
             f"{PROXY_BASE_URL}/verify-attestation",
             headers={'Content-Type': 'application/json'},
             json=data,
@@ -180,9 +222,9 @@ def deliver_data(request_id, attestation_response, proof):
     
     try:
         # Clean hex values (remove 0x)
-        clean_request_id = request_id[2:] if request_id.startswith('0x') else request_id
-        clean_attestation = attestation_response[2:] if attestation_response.startswith('0x') else attestation_response
-        clean_proof = proof[2:] if proof.startswith('0x') else proof
+        clean_request_id = _strip0x(request_id)
+        clean_attestation = _strip0x(attestation_response)
+        clean_proof = _strip0x(proof)
         
         data = {
             "request_id": clean_request_id,
@@ -190,7 +232,7 @@ def deliver_data(request_id, attestation_response, proof):
             "proof": clean_proof
         }
         
-        response = requests.post(
+        response = SESSION.post(
             f"{PROXY_BASE_URL}/deliver-data",
             headers={'Content-Type': 'application/json'},
             json=data,
@@ -6,9 +6,18 @@ Handles API calls to the Copernicus Data Space Ecosystem using STAC API
 import os
 import json
 import logging
+import socket
+import threading
+import time
+import orjson
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -21,9 +30,118 @@ TOKEN_URL = "https://identity.dataspace.copernicus.eu/auth/realms/CDSE/protocol/
 STAC_URL = "https://stac.dataspace.copernicus.eu/v1"
 ODATA_URL = "https://catalogue.dataspace.copernicus.eu/odata/v1/Products"
 
-# Token management
+# Chunk size for streaming preview/thumbnail downloads
+PREVIEW_CHUNK_SIZE = 64 * 1024
+
+# Asset keys checked for a preview image, in order of preference
+_ASSET_PRIORITY = ('thumbnail', 'preview', 'overview', 'browse')
+
+# Query the STAC and OData sources concurrently instead of sequentially when
+# looking up product metadata/previews. Off by default: it roughly doubles
+# the request load in exchange for hiding the fallback round-trip.
+CONCURRENT_FALLBACK = os.getenv('CDSE_CONCURRENT_FALLBACK', '0') == '1'
+
+class _TTLCache:
+    """Small thread-safe TTL cache for repeated catalogue lookups"""
+
+    def __init__(self, maxsize, ttl):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data = {}  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            if len(self._data) >= self._maxsize:
+                # Evict expired entries first, then oldest-inserted
+                now = time.monotonic()
+                for stale in [k for k, (exp, _) in self._data.items() if now >= exp]:
+                    del self._data[stale]
+                while len(self._data) >= self._maxsize:
+                    del self._data[next(iter(self._data))]
+            self._data[key] = (time.monotonic() + self._ttl, value)
+
+# Product metadata is immutable for a given product id, so repeat lookups
+# within an hour are served from memory instead of a STAC+OData round-trip
+_metadata_cache = _TTLCache(maxsize=1024, ttl=3600)
+
+@dataclass(slots=True)
+class _SearchInfo:
+    """Per-search bookkeeping for the progressive fallback (internal only)"""
+    strategy_used: str | None = None
+    actual_date_range: str | None = None
+    cloud_coverage_used: int = 10
+    total_attempts: int = 0
+
+# Progressive search strategies, built once at import time.
+# A cloud_max of None means "use the caller's cloud_cover_max".
+SEARCH_STRATEGIES = (
+    # Phase 1: Try original date range with low cloud coverage
+    {'days_before': 0, 'days_after': 0, 'cloud_max': None, 'description': 'original date range'},
+
+    # Phase 2: Expand date range while keeping low cloud coverage
+    {'days_before': 7, 'days_after': 7, 'cloud_max': None, 'description': '±1 week expanded'},
+    {'days_before': 14, 'days_after': 14, 'cloud_max': None, 'description': '±2 weeks expanded'},
+    {'days_before': 30, 'days_after': 30, 'cloud_max': None, 'description': '±1 month expanded'},
+
+    # Phase 3: If still no results, try higher cloud coverage with expanded dates
+    {'days_before': 7, 'days_after': 7, 'cloud_max': 15, 'description': '±1 week, 15% clouds'},
+    {'days_before': 14, 'days_after': 14, 'cloud_max': 15, 'description': '±2 weeks, 15% clouds'},
+    {'days_before': 30, 'days_after': 30, 'cloud_max': 20, 'description': '±1 month, 20% clouds'}
+)
+
+# Shared HTTP session so connections to the identity, STAC and OData hosts
+# are reused via keep-alive instead of opening a new TCP+TLS connection per call
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+)
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+
+# Warm the resolver for the CDSE hosts at import so the first request of a
+# search doesn't pay the getaddrinfo round-trip on top of TCP+TLS setup.
+# Best-effort and off the main thread: a failure here just means the first
+# real request resolves the name itself.
+_CDSE_HOSTS = (
+    'identity.dataspace.copernicus.eu',
+    'stac.dataspace.copernicus.eu',
+    'catalogue.dataspace.copernicus.eu'
+)
+
+def _prewarm_dns():
+    for host in _CDSE_HOSTS:
+        try:
+            socket.getaddrinfo(host, 443)
+        except OSError:
+            pass
+
+threading.Thread(target=_prewarm_dns, name='cdse-dns-prewarm', daemon=True).start()
+
+# Shared worker pool for concurrent STAC requests. Persistent rather than
+# per-call, so the worker threads and the keep-alive connections they warm
+# up in SESSION's pool survive across searches and in-flight requests to the
+# same host ride already-open TLS connections.
+_EXECUTOR = ThreadPoolExecutor(max_workers=4)
+
+# Token management (monotonic seconds; the lock keeps concurrent STAC
+# searches from racing to the token endpoint when the cache goes stale)
 access_token = None
-token_expiry = 0
+token_expiry = 0.0
+_token_lock = threading.Lock()
 
 def get_access_token():
     """
@@ -32,52 +150,54 @@ def get_access_token():
         str|None: Access token or None if authentication is skipped
     """
     global access_token, token_expiry
-    
-    import time
-    now = int(time.time() * 1000)
-    
-    # Return cached token if still valid
-    if access_token and now < token_expiry - 60000:  # 1 minute buffer
+
+    # Fast path: return cached token if still valid (1 minute buffer)
+    if access_token and time.monotonic() < token_expiry - 60:
         return access_token
-    
+
     # Get credentials from environment variables
     client_id = os.getenv('CDSE_CLIENT_ID')
     client_secret = os.getenv('CDSE_CLIENT_SECRET')
-    
+
     # Check if credentials are provided
     if not client_id or not client_secret:
         logger.info('No CDSE credentials provided. Skipping authentication.')
         return None
-    
-    try:
-        logger.info('Getting new CDSE access token...')
-        
-        # Request new token
-        response = requests.post(
-            TOKEN_URL,
-            data={
-                "grant_type": "client_credentials",
-                "client_id": client_id,
-                "client_secret": client_secret
-            }
-        )
-        
-        if response.status_code != 200:
-            logger.error(f"Failed to get access token: {response.text}")
+
+    with _token_lock:
+        # Re-check under the lock: another thread may have refreshed already
+        if access_token and time.monotonic() < token_expiry - 60:
+            return access_token
+
+        try:
+            logger.info('Getting new CDSE access token...')
+
+            # Request new token
+            response = SESSION.post(
+                TOKEN_URL,
+                data={
+                    "grant_type": "client_credentials",
+                    "client_id": client_id,
+                    "client_secret": client_secret
+                }
+            )
+
+            if response.status_code != 200:
+                logger.error("Failed to get access token: %s", response.text)
+                return None
+
+            token_data = response.json()
+
+            # Store token and expiry
+            access_token = token_data["access_token"]
+            token_expiry = time.monotonic() + token_data["expires_in"]
+
+            logger.info('Successfully obtained CDSE access token')
+            return access_token
+        except Exception as e:
+            logger.error('Error getting CDSE access token: %s', str(e))
+            logger.info('Proceeding without authentication (some features may be limited)')
             return None
-        
-        token_data = response.json()
-        
-        # Store token and expiry
-        access_token = token_data["access_token"]
-        token_expiry = now + (token_data["expires_in"] * 1000)
-        
-        logger.info('Successfully obtained CDSE access token')
-        return access_token
-    except Exception as e:
-        logger.error(f'Error getting CDSE access token: {str(e)}')
-        logger.info('Proceeding without authentication (some features may be limited)')
-        return None
 
 def coordinates_to_bbox(coords):
     """
@@ -87,35 +207,57 @@ def coordinates_to_bbox(coords):
     Returns:
         list: Bounding box [west, south, east, north]
     """
-    # Handle string representation of coordinates
+    # Fast path: a 4-element numeric list/tuple is already a bbox
+    if (isinstance(coords, (list, tuple)) and len(coords) == 4
+            and all(isinstance(v, (int, float)) for v in coords)):
+        return list(coords)
+
+    # String fallback: callers should pass structured data; parsing here is
+    # a redundant round-trip when the caller already had the parsed value
     if isinstance(coords, str):
+        logger.warning('coordinates_to_bbox received a JSON string; pass a parsed list instead')
         try:
             # Try to parse as JSON
             coords = json.loads(coords)
         except json.JSONDecodeError:
             # If not valid JSON, return default bbox
-            logger.warning(f"Invalid coordinates format: {coords}")
+            logger.warning("Invalid coordinates format: %s", coords)
             return [2.1, 41.3, 2.3, 41.5]  # Default to Barcelona area
     
-    if not coords or not isinstance(coords, list) or len(coords) < 3:
+    # Tuples come from hoisted constant pools (e.g. the end-to-end test's
+    # location table), so they get the same polygon treatment as lists
+    if not coords or not isinstance(coords, (list, tuple)) or len(coords) < 3:
         # Default to a bounding box around Barcelona for demo
         return [2.1, 41.3, 2.3, 41.5]  # [west, south, east, north]
     
-    # Extract lat/lng values
-    lats = [point[0] for point in coords]
-    lngs = [point[1] for point in coords]
-    
-    # Calculate bounding box
-    west = min(lngs)
-    south = min(lats)
-    east = max(lngs)
-    north = max(lats)
-    
+    # Calculate bounding box in a single pass over the points instead of
+    # building intermediate lat/lng lists and scanning them four times
+    south = north = coords[0][0]
+    west = east = coords[0][1]
+    for point in coords[1:]:
+        lat, lng = point[0], point[1]
+        if lat < south:
+            south = lat
+        elif lat > north:
+            north = lat
+        if lng < west:
+            west = lng
+        elif lng > east:
+            east = lng
+
     return [west, south, east, north]
 
+@lru_cache(maxsize=128)
+def _parse_date(date_str):
+    """Parse a YYYY-MM-DD date string (cached - strptime is surprisingly costly)"""
+    return datetime.strptime(date_str, '%Y-%m-%d')
+
+@lru_cache(maxsize=512)
 def expand_date_range(start_date_str, end_date_str, days_before, days_after):
     """
     Expand date range by specified number of days
+    Pure function of its arguments, so results are memoized: a single
+    progressive search calls this once per strategy with the same dates.
     Args:
         start_date_str (str): Start date string (YYYY-MM-DD)
         end_date_str (str): End date string (YYYY-MM-DD)
@@ -125,17 +267,44 @@ def expand_date_range(start_date_str, end_date_str, days_before, days_after):
         tuple: (new_start_date_str, new_end_date_str)
     """
     try:
-        start_date = datetime.strptime(start_date_str, '%Y-%m-%d')
-        end_date = datetime.strptime(end_date_str, '%Y-%m-%d')
-        
+        start_date = _parse_date(start_date_str)
+        end_date = _parse_date(end_date_str)
+
         new_start = start_date - timedelta(days=days_before)
         new_end = end_date + timedelta(days=days_after)
-        
+
         return new_start.strftime('%Y-%m-%d'), new_end.strftime('%Y-%m-%d')
     except Exception as e:
-        logger.warning(f"Error expanding date range: {str(e)}")
+        logger.warning("Error expanding date range: %s", str(e))
         return start_date_str, end_date_str
 
+# Constant day-boundary suffixes for STAC datetime intervals
+_DAY_START = 'T00:00:00Z'
+_DAY_END = 'T23:59:59Z'
+
+@lru_cache(maxsize=512)
+def _build_date_range(start_date_str, end_date_str, days_before, days_after):
+    """Expand a date range and format the STAC datetime interval in one step
+    Cached per input tuple, so across searches the same expansion produces
+    the interval string exactly once.
+    Returns:
+        tuple: (expanded_start, expanded_end, date_range)
+    """
+    expanded_start, expanded_end = expand_date_range(
+        start_date_str, end_date_str, days_before, days_after
+    )
+    return expanded_start, expanded_end, f"{expanded_start}{_DAY_START}/{expanded_end}{_DAY_END}"
+
+def _sanitize_features(features):
+    """Drop malformed entries from a STAC feature list in one up-front pass
+    so the hot loops downstream can index 'id' and 'properties' directly
+    instead of re-checking every field with .get() fallbacks"""
+    return [
+        feature for feature in features
+        if isinstance(feature, dict) and 'id' in feature
+        and isinstance(feature.get('properties'), dict)
+    ]
+
 def perform_stac_search(token, collection, bbox, date_range, cloud_cover_max, limit):
     """
     Perform a single STAC API search with given parameters
@@ -189,19 +358,20 @@ def perform_stac_search(token, collection, bbox, date_range, cloud_cover_max, li
         if token:
             headers['Authorization'] = f"Bearer {token}"
         
-        # Make the API request
-        response = requests.post(url, headers=headers, json=search_payload)
+        # Make the API request (orjson serializes/parses the payload several
+        # times faster than stdlib json on the large STAC feature collections)
+        response = SESSION.post(url, headers=headers, data=orjson.dumps(search_payload))
         
         if response.status_code != 200:
-            logger.error(f"STAC API request failed: {response.text}")
+            logger.error("STAC API request failed: %s", response.text)
             return []
         
-        # Extract features from STAC response
-        features = response.json().get('features', [])
-        return features
+        # Extract and validate features from STAC response
+        features = orjson.loads(response.content).get('features', [])
+        return _sanitize_features(features)
         
     except Exception as e:
-        logger.error(f'Error in STAC search: {str(e)}')
+        logger.error('Error in STAC search: %s', str(e))
         return []
 
 def search_satellite_data(data_type, coordinates, start_date, end_date, cloud_cover_max=10, limit=10):
@@ -235,230 +405,334 @@ def search_satellite_data(data_type, coordinates, start_date, end_date, cloud_co
         # Get the STAC collection name
         collection = collection_map.get(data_type, 'sentinel-2-l2a')
         
-        logger.info(f'Starting progressive search for {data_type} with ≤{cloud_cover_max}% cloud coverage')
-        
-        # Define search strategies with progressive fallback
-        search_strategies = [
-            # Phase 1: Try original date range with low cloud coverage
-            {'days_before': 0, 'days_after': 0, 'cloud_max': cloud_cover_max, 'description': 'original date range'},
-            
-            # Phase 2: Expand date range while keeping low cloud coverage
-            {'days_before': 7, 'days_after': 7, 'cloud_max': cloud_cover_max, 'description': '±1 week expanded'},
-            {'days_before': 14, 'days_after': 14, 'cloud_max': cloud_cover_max, 'description': '±2 weeks expanded'},
-            {'days_before': 30, 'days_after': 30, 'cloud_max': cloud_cover_max, 'description': '±1 month expanded'},
-            
-            # Phase 3: If still no results, try higher cloud coverage with expanded dates
-            {'days_before': 7, 'days_after': 7, 'cloud_max': 15, 'description': '±1 week, 15% clouds'},
-            {'days_before': 14, 'days_after': 14, 'cloud_max': 15, 'description': '±2 weeks, 15% clouds'},
-            {'days_before': 30, 'days_after': 30, 'cloud_max': 20, 'description': '±1 month, 20% clouds'}
-        ]
+        logger.info('Starting progressive search for %s with ≤%s%% cloud coverage', data_type, cloud_cover_max)
         
         # Track search results
         final_results = []
-        search_info = {
-            'strategy_used': None,
-            'actual_date_range': None,
-            'cloud_coverage_used': cloud_cover_max,
-            'total_attempts': 0
-        }
-        
-        # Try each search strategy progressively
-        for strategy in search_strategies:
-            search_info['total_attempts'] += 1
-            
-            # Expand date range
-            expanded_start, expanded_end = expand_date_range(
-                start_date, end_date, 
-                strategy['days_before'], strategy['days_after']
-            )
-            
-            # Format dates for STAC API
-            formatted_start = f"{expanded_start}T00:00:00Z"
-            formatted_end = f"{expanded_end}T23:59:59Z"
-            date_range = f"{formatted_start}/{formatted_end}"
-            
-            logger.info(f'Attempt {search_info["total_attempts"]}: Searching with {strategy["description"]} (≤{strategy["cloud_max"]}% clouds)')
-            logger.info(f'  Date range: {expanded_start} to {expanded_end}')
-            
-            # Perform the search
-            features = perform_stac_search(
-                token, collection, bbox, date_range, 
-                strategy['cloud_max'], limit
-            )
-            
-            if features:
-                logger.info(f'SUCCESS: Found {len(features)} images using {strategy["description"]}')
-                
+        search_info = _SearchInfo(cloud_coverage_used=cloud_cover_max)
+        
+        # Group the strategies into stages: the original date range runs alone,
+        # then the expanded-range fallbacks of each phase are raced concurrently.
+        # The searches within a stage are independent queries, so overlapping
+        # their round-trips costs ~one RTT per stage instead of one per attempt.
+        strategy_stages = [
+            SEARCH_STRATEGIES[:1],   # Phase 1: original date range
+            SEARCH_STRATEGIES[1:4],  # Phase 2: expanded dates, low clouds
+            SEARCH_STRATEGIES[4:]    # Phase 3: expanded dates, relaxed clouds
+        ]
+
+        # Try each stage progressively
+        for stage in strategy_stages:
+            # Build the expanded date range for every strategy in this stage
+            attempts = []
+            for strategy in stage:
+                search_info.total_attempts += 1
+
+                # Resolve the strategy's cloud cover cap (None = caller's value)
+                cloud_max = strategy['cloud_max'] if strategy['cloud_max'] is not None else cloud_cover_max
+
+                # Expand the date range and build the STAC datetime interval
+                expanded_start, expanded_end, date_range = _build_date_range(
+                    start_date, end_date,
+                    strategy['days_before'], strategy['days_after']
+                )
+
+                logger.info('Attempt %d: Searching with %s (≤%s%% clouds)', search_info.total_attempts, strategy['description'], cloud_max)
+                logger.info('  Date range: %s to %s', expanded_start, expanded_end)
+
+                attempts.append((strategy, expanded_start, expanded_end, date_range, cloud_max))
+
+            # Dispatch the stage's searches concurrently (requests.Session is
+            # thread-safe for GET/POST, so the shared SESSION can be reused)
+            if len(attempts) == 1:
+                strategy, _, _, date_range, cloud_max = attempts[0]
+                stage_features = [perform_stac_search(
+                    token, collection, bbox, date_range,
+                    cloud_max, limit
+                )]
+            else:
+                futures = [
+                    _EXECUTOR.submit(
+                        perform_stac_search,
+                        token, collection, bbox, date_range,
+                        cloud_max, limit
+                    )
+                    for strategy, _, _, date_range, cloud_max in attempts
+                ]
+                stage_features = [future.result() for future in futures]
+
+            # Pick the first successful strategy in priority order
+            for (strategy, expanded_start, expanded_end, date_range, cloud_max), features in zip(attempts, stage_features):
+                if not features:
+                    logger.info('  No results found with %s', strategy['description'])
+                    continue
+
+                logger.info('SUCCESS: Found %d images using %s', len(features), strategy['description'])
+
                 # Update search info
-                search_info['strategy_used'] = strategy['description']
-                search_info['actual_date_range'] = f"{expanded_start} to {expanded_end}"
-                search_info['cloud_coverage_used'] = strategy['cloud_max']
-                
-                # Log cloud coverage for each result
-                for feature in features[:3]:  # Log first 3 results
-                    cloud_cover = feature['properties'].get('eo:cloud_cover', 'N/A')
-                    logger.info(f'  - {feature["id"]}: {cloud_cover}% cloud coverage')
-                
-                # Convert STAC features to simplified format
+                search_date_range = f"{expanded_start} to {expanded_end}"
+                search_info.strategy_used = strategy['description']
+                search_info.actual_date_range = search_date_range
+                search_info.cloud_coverage_used = cloud_max
+
+                # Log cloud coverage for the first results (skip the loop
+                # entirely when INFO is disabled)
+                if logger.isEnabledFor(logging.INFO):
+                    for feature in features[:3]:  # Log first 3 results
+                        cloud_cover = feature['properties'].get('eo:cloud_cover', 'N/A')
+                        logger.info('  - %s: %s%% cloud coverage', feature['id'], cloud_cover)
+
+                # Convert STAC features to simplified format. Assets,
+                # properties and geometry are shared by reference with the
+                # parsed feature (no copies); the sub-dicts are bound once so
+                # the hot loop does a single lookup per field, and the search
+                # metadata strings are built once outside the loop.
                 for feature in features:
+                    assets = feature.get('assets') or {}
+                    props = feature['properties']  # validated in perform_stac_search
+
                     # Find thumbnail or preview image
-                    thumbnail_url = None
-                    if 'assets' in feature:
-                        for asset_type in ['thumbnail', 'preview', 'overview', 'browse']:
-                            if asset_type in feature['assets'] and 'href' in feature['assets'][asset_type]:
-                                thumbnail_url = feature['assets'][asset_type]['href']
-                                break
-                    
-                    # Create result object
-                    result = {
+                    thumbnail_url = next(
+                        (assets[asset_type]['href']
+                         for asset_type in _ASSET_PRIORITY
+                         if asset_type in assets and 'href' in assets[asset_type]),
+                        None
+                    )
+
+                    final_results.append({
                         'id': feature['id'],
                         'name': feature['id'],
-                        'datetime': feature['properties'].get('datetime'),
-                        'cloud_cover': feature['properties'].get('eo:cloud_cover', 0),
+                        'datetime': props.get('datetime'),
+                        'cloud_cover': props.get('eo:cloud_cover', 0),
                         'thumbnail_url': thumbnail_url,
-                        'assets': feature.get('assets', {}),
-                        'properties': feature.get('properties', {}),
+                        'assets': assets,
+                        'properties': props,
                         'bbox': feature.get('bbox'),
                         'geometry': feature.get('geometry'),
                         # Add search metadata
                         'search_strategy': strategy['description'],
-                        'search_date_range': f"{expanded_start} to {expanded_end}"
-                    }
-                    
-                    final_results.append(result)
-                
-                # Success - return results
+                        'search_date_range': search_date_range
+                    })
+
+                # Success - stop checking lower-priority strategies
+                break
+
+            if final_results:
                 break
-            else:
-                logger.info(f'  No results found with {strategy["description"]}')
         
         # Log final results
         if final_results:
-            logger.info(f'FINAL RESULT: Found {len(final_results)} images after {search_info["total_attempts"]} attempts')
-            logger.info(f'  Strategy: {search_info["strategy_used"]}')
-            logger.info(f'  Date range: {search_info["actual_date_range"]}')
-            logger.info(f'  Max cloud coverage: {search_info["cloud_coverage_used"]}%')
+            logger.info('FINAL RESULT: Found %d images after %d attempts', len(final_results), search_info.total_attempts)
+            logger.info('  Strategy: %s', search_info.strategy_used)
+            logger.info('  Date range: %s', search_info.actual_date_range)
+            logger.info('  Max cloud coverage: %s%%', search_info.cloud_coverage_used)
         else:
-            logger.warning(f'NO RESULTS: No suitable images found after {search_info["total_attempts"]} attempts')
+            logger.warning('NO RESULTS: No suitable images found after %d attempts', search_info.total_attempts)
             logger.info('  Try expanding the search area or using a different time period')
         
         return final_results
         
     except Exception as e:
-        logger.error(f'Error in progressive satellite data search: {str(e)}')
+        logger.error('Error in progressive satellite data search: %s', str(e))
         return []
 
+def _preview_from_stac(token, product_id, headers):
+    """Look up the product's preview assets via STAC and stream the first hit"""
+    # Search for the product by ID
+    search_payload = {
+        "ids": [product_id],
+        "limit": 1
+    }
+
+    search_url = f"{STAC_URL}/search"
+    search_headers = {
+        'Content-Type': 'application/json',
+        'Accept': 'application/json'
+    }
+
+    if token:
+        search_headers['Authorization'] = f"Bearer {token}"
+
+    search_response = SESSION.post(search_url, headers=search_headers, data=orjson.dumps(search_payload))
+
+    if search_response.status_code == 200:
+        features = orjson.loads(search_response.content).get('features', [])
+
+        if features:
+            feature = features[0]
+            assets = feature.get('assets') or {}
+
+            # Try to get thumbnail or preview image
+            for asset_type in _ASSET_PRIORITY:
+                if asset_type in assets and 'href' in assets[asset_type]:
+                    thumbnail_url = assets[asset_type]['href']
+                    logger.info('Found thumbnail URL: %s', thumbnail_url)
+
+                    # Get the thumbnail as a stream so bytes can be
+                    # forwarded downstream as they arrive instead of
+                    # buffering the whole image in memory first
+                    response = SESSION.get(thumbnail_url, headers=headers, stream=True)
+
+                    if response.status_code == 200:
+                        return {
+                            'data_iter': response.iter_content(chunk_size=PREVIEW_CHUNK_SIZE),
+                            'content_type': response.headers.get('content-type', 'image/jpeg'),
+                            'source': f'stac_{asset_type}',
+                            'response': response
+                        }
+                    # Release the streamed connection back to the pool
+                    response.close()
+    return None
+
+def _preview_from_odata(product_id, headers, kind):
+    """Stream a preview image from the OData API (kind: Quicklook|Thumbnail)"""
+    preview_url = f"{ODATA_URL}('{product_id}')/Products('{kind}')/$value"
+    logger.info('Trying OData %s URL: %s', kind.lower(), preview_url)
+
+    response = SESSION.get(preview_url, headers=headers, stream=True)
+
+    if response.status_code == 200:
+        return {
+            'data_iter': response.iter_content(chunk_size=PREVIEW_CHUNK_SIZE),
+            'content_type': response.headers.get('content-type', 'image/jpeg'),
+            'source': f'odata_{kind.lower()}',
+            'response': response
+        }
+    # Release the streamed connection back to the pool
+    response.close()
+    return None
+
 def get_product_preview(product_id):
     """
     Get preview image for a product
+    Tries the STAC assets first, then the OData quicklook/thumbnail. With
+    CDSE_CONCURRENT_FALLBACK=1 all three sources are fetched concurrently
+    and the best (STAC-first) hit wins, trading extra request load for
+    max() instead of sum() of the source latencies.
     Args:
         product_id (str): Product ID
     Returns:
-        dict: Preview image data with content type
+        dict: Streaming preview image data (data_iter) with content type
     """
     try:
         # Get access token
         token = get_access_token()
-        
-        logger.info(f'Getting preview image for product: {product_id}')
-        
+
+        logger.info('Getting preview image for product: %s', product_id)
+
         # Prepare headers
         headers = {
             'Accept': 'image/*',
             'Accept-Encoding': 'gzip, deflate'
         }
-        
+
         # Add authorization header if token is available
         if token:
             headers['Authorization'] = f"Bearer {token}"
-        
-        # Try to get the product metadata to find the thumbnail URL
-        try:
-            # Search for the product by ID
-            search_payload = {
-                "ids": [product_id],
-                "limit": 1
-            }
-            
-            search_url = f"{STAC_URL}/search"
-            search_headers = {
-                'Content-Type': 'application/json',
-                'Accept': 'application/json'
-            }
-            
-            if token:
-                search_headers['Authorization'] = f"Bearer {token}"
-            
-            search_response = requests.post(search_url, headers=search_headers, json=search_payload)
-            
-            if search_response.status_code == 200:
-                features = search_response.json().get('features', [])
-                
-                if features:
-                    feature = features[0]
-                    
-                    # Check if we have assets with thumbnails
-                    if 'assets' in feature:
-                        # Try to get thumbnail or preview image
-                        for asset_type in ['thumbnail', 'preview', 'overview', 'browse']:
-                            if asset_type in feature['assets'] and 'href' in feature['assets'][asset_type]:
-                                thumbnail_url = feature['assets'][asset_type]['href']
-                                logger.info(f'Found thumbnail URL: {thumbnail_url}')
-                                
-                                # Get the thumbnail
-                                response = requests.get(thumbnail_url, headers=headers)
-                                
-                                if response.status_code == 200:
-                                    return {
-                                        'data': response.content,
-                                        'content_type': response.headers.get('content-type', 'image/jpeg'),
-                                        'source': f'stac_{asset_type}'
-                                    }
-        except Exception as e:
-            logger.warning(f'Error getting product metadata from STAC API: {str(e)}')
-        
-        # Fallback to OData API for thumbnails if STAC doesn't provide them
-        try:
-            preview_url = f"{ODATA_URL}('{product_id}')/Products('Quicklook')/$value"
-            logger.info(f'Falling back to OData quicklook URL: {preview_url}')
-            
-            response = requests.get(preview_url, headers=headers)
-            
-            if response.status_code == 200:
-                return {
-                    'data': response.content,
-                    'content_type': response.headers.get('content-type', 'image/jpeg'),
-                    'source': 'odata_quicklook'
-                }
-        except Exception as e:
-            logger.warning(f'Error getting quicklook from OData API: {str(e)}')
-            
-            # If quicklook fails, try thumbnail
-            try:
-                thumbnail_url = f"{ODATA_URL}('{product_id}')/Products('Thumbnail')/$value"
-                logger.info(f'Trying OData thumbnail URL: {thumbnail_url}')
-                
-                response = requests.get(thumbnail_url, headers=headers)
-                
-                if response.status_code == 200:
-                    return {
-                        'data': response.content,
-                        'content_type': response.headers.get('content-type', 'image/jpeg'),
-                        'source': 'odata_thumbnail'
-                    }
-            except Exception as e:
-                logger.warning(f'Error getting thumbnail from OData API: {str(e)}')
-        
+
+        fetchers = (
+            lambda: _preview_from_stac(token, product_id, headers),
+            lambda: _preview_from_odata(product_id, headers, 'Quicklook'),
+            lambda: _preview_from_odata(product_id, headers, 'Thumbnail')
+        )
+
+        if CONCURRENT_FALLBACK:
+            futures = [_EXECUTOR.submit(fetcher) for fetcher in fetchers]
+            # Drain every future: the losers hold open streamed responses
+            # that must be closed, or their sockets stay checked out of the
+            # shared adapter pool until GC
+            winner = None
+            for future in futures:
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.warning('Error getting product preview source: %s', str(e))
+                    continue
+                if result is None:
+                    continue
+                if winner is None:
+                    winner = result
+                else:
+                    try:
+                        result['response'].close()
+                    except Exception:
+                        pass
+            if winner:
+                return winner
+        else:
+            for fetcher in fetchers:
+                try:
+                    result = fetcher()
+                except Exception as e:
+                    logger.warning('Error getting product preview source: %s', str(e))
+                    continue
+                if result:
+                    return result
+
         # If all attempts fail, return None
         logger.error('Failed to get product preview')
         return None
     except Exception as e:
-        logger.error(f'Error getting product preview: {str(e)}')
+        logger.error('Error getting product preview: %s', str(e))
         return None
 
+def _metadata_from_stac(token, product_id):
+    """Fetch the product item from the STAC API"""
+    # Search for the product by ID
+    search_payload = {
+        "ids": [product_id],
+        "limit": 1
+    }
+
+    search_url = f"{STAC_URL}/search"
+
+    # Prepare headers
+    headers = {
+        'Content-Type': 'application/json',
+        'Accept': 'application/json'
+    }
+
+    # Add authorization header if token is available
+    if token:
+        headers['Authorization'] = f"Bearer {token}"
+
+    search_response = SESSION.post(search_url, headers=headers, data=orjson.dumps(search_payload))
+
+    if search_response.status_code == 200:
+        features = orjson.loads(search_response.content).get('features', [])
+
+        if features:
+            logger.info('Found item in STAC API')
+            return features[0]
+    return None
+
+def _metadata_from_odata(token, product_id):
+    """Fetch the product entry from the OData API"""
+    url = f"{ODATA_URL}('{product_id}')"
+
+    # Prepare headers
+    headers = {
+        'Accept': 'application/json'
+    }
+
+    # Add authorization header if token is available
+    if token:
+        headers['Authorization'] = f"Bearer {token}"
+
+    response = SESSION.get(url, headers=headers)
+
+    if response.status_code == 200:
+        logger.info('Found item in OData API')
+        return orjson.loads(response.content)
+    return None
+
 def get_product_metadata(product_id):
     """
     Get product metadata
+    Tries the STAC API first with the OData catalogue as fallback. With
+    CDSE_CONCURRENT_FALLBACK=1 both are queried concurrently and the STAC
+    result is preferred, so a STAC miss costs max() instead of sum() of
+    the two round-trips.
     Args:
         product_id (str): Product ID
     Returns:
@@ -467,64 +741,55 @@ def get_product_metadata(product_id):
     try:
         # Get access token
         token = get_access_token()
-        
-        logger.info(f'Getting metadata for product: {product_id}')
-        
-        # Try to get the item from STAC API
-        try:
-            # Search for the product by ID
-            search_payload = {
-                "ids": [product_id],
-                "limit": 1
-            }
-            
-            search_url = f"{STAC_URL}/search"
-            
-            # Prepare headers
-            headers = {
-                'Content-Type': 'application/json',
-                'Accept': 'application/json'
-            }
-            
-            # Add authorization header if token is available
-            if token:
-                headers['Authorization'] = f"Bearer {token}"
-            
-            search_response = requests.post(search_url, headers=headers, json=search_payload)
-            
-            if search_response.status_code == 200:
-                features = search_response.json().get('features', [])
-                
-                if features:
-                    logger.info('Found item in STAC API')
-                    return features[0]
-        except Exception as e:
-            logger.warning(f'Error getting item from STAC API: {str(e)}')
-        
-        # Fallback to OData API
-        try:
-            url = f"{ODATA_URL}('{product_id}')"
-            
-            # Prepare headers
-            headers = {
-                'Accept': 'application/json'
-            }
-            
-            # Add authorization header if token is available
-            if token:
-                headers['Authorization'] = f"Bearer {token}"
-            
-            response = requests.get(url, headers=headers)
-            
-            if response.status_code == 200:
-                logger.info('Found item in OData API')
-                return response.json()
-        except Exception as e:
-            logger.warning(f'Error getting item from OData API: {str(e)}')
-        
+
+        logger.info('Getting metadata for product: %s', product_id)
+
+        cached = _metadata_cache.get(product_id)
+        if cached is not None:
+            logger.info('Serving product metadata from cache')
+            return cached
+
+        if CONCURRENT_FALLBACK:
+            stac_future = _EXECUTOR.submit(_metadata_from_stac, token, product_id)
+            odata_future = _EXECUTOR.submit(_metadata_from_odata, token, product_id)
+
+            try:
+                result = stac_future.result()
+                if result:
+                    _metadata_cache.set(product_id, result)
+                    return result
+            except Exception as e:
+                logger.warning('Error getting item from STAC API: %s', str(e))
+
+            try:
+                result = odata_future.result()
+                if result:
+                    _metadata_cache.set(product_id, result)
+                    return result
+            except Exception as e:
+                logger.warning('Error getting item from OData API: %s', str(e))
+        else:
+            # Try to get the item from STAC API
+            try:
+                result = _metadata_from_stac(token, product_id)
+                if result:
+                    _metadata_cache.set(product_id, result)
+                    return result
+            except Exception as e:
+                logger.warning('Error getting item from STAC API: %s', str(e))
+
+            # Fallback to OData API
+            try:
+                result = _metadata_from_odata(token, product_id)
+                if result:
+                    _metadata_cache.set(product_id, result)
+                    return result
+            except Exception as e:
+                logger.warning('Error getting item from OData API: %s', str(e))
+
         # If all attempts fail, return None
         logger.error('Failed to get product metadata')
         return None
     except Exception as e:
-        logger.error(f'Error getting product metadata: {str(e)}')
+        logger.error('Error getting product metadata: %s', str(e))
         return None
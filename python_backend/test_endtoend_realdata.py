@@ -16,6 +16,8 @@ import json
 import time
 import hashlib
 import random
+import orjson
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 
@@ -34,29 +36,58 @@ except ImportError as e:
 # Load environment variables
 load_dotenv()
 
+# Interesting locations around the world, hoisted to a module constant so
+# each pick is O(1) over a prebuilt immutable sequence instead of
+# reallocating the dicts and coordinate lists on every call
+_LOCATIONS = (
+    {"name": "Rome, Italy", "coords": ((41.9028, 12.4964), (41.8928, 12.5064), (41.9128, 12.5164), (41.9228, 12.4864))},
+    {"name": "Barcelona, Spain", "coords": ((41.3851, 2.1734), (41.3751, 2.1834), (41.3951, 2.1934), (41.4051, 2.1634))},
+    {"name": "Amsterdam, Netherlands", "coords": ((52.3676, 4.9041), (52.3576, 4.9141), (52.3776, 4.9241), (52.3876, 4.8941))},
+    {"name": "Berlin, Germany", "coords": ((52.5200, 13.4050), (52.5100, 13.4150), (52.5300, 13.4250), (52.5400, 13.3950))},
+    {"name": "Paris, France", "coords": ((48.8566, 2.3522), (48.8466, 2.3622), (48.8666, 2.3722), (48.8766, 2.3422))},
+    {"name": "London, UK", "coords": ((51.5074, -0.1278), (51.4974, -0.1178), (51.5174, -0.1078), (51.5274, -0.1378))},
+    {"name": "Vienna, Austria", "coords": ((48.2082, 16.3738), (48.1982, 16.3838), (48.2182, 16.3938), (48.2282, 16.3638))},
+    {"name": "Copenhagen, Denmark", "coords": ((55.6761, 12.5683), (55.6661, 12.5783), (55.6861, 12.5883), (55.6961, 12.5583))}
+)
+
+_DAY = timedelta(days=1)
+
+@dataclass(slots=True)
+class SatelliteProduct:
+    """Typed view of one search result.
+
+    Downstream code reads each field several times; slotted attribute access
+    replaces repeated dict hashing and .get() calls, and the fields double
+    as documentation of what the flow actually consumes.
+    """
+    id: str
+    datetime: str
+    cloud_cover: float = 0.0
+    bbox: list = field(default_factory=list)
+    search_strategy: str = None
+
+def _to_product(result):
+    """Convert a raw search-result dict into a SatelliteProduct"""
+    return SatelliteProduct(
+        id=result['id'],
+        datetime=result['datetime'],
+        cloud_cover=result.get('cloud_cover') or 0.0,
+        bbox=list(result.get('bbox') or []),
+        search_strategy=result.get('search_strategy')
+    )
+
 def generate_random_location():
     """Generate a random location with coordinates for testing"""
     
-    # List of interesting locations around the world
-    locations = [
-        {"name": "Rome, Italy", "coords": [[41.9028, 12.4964], [41.8928, 12.5064], [41.9128, 12.5164], [41.9228, 12.4864]]},
-        {"name": "Barcelona, Spain", "coords": [[41.3851, 2.1734], [41.3751, 2.1834], [41.3951, 2.1934], [41.4051, 2.1634]]},
-        {"name": "Amsterdam, Netherlands", "coords": [[52.3676, 4.9041], [52.3576, 4.9141], [52.3776, 4.9241], [52.3876, 4.8941]]},
-        {"name": "Berlin, Germany", "coords": [[52.5200, 13.4050], [52.5100, 13.4150], [52.5300, 13.4250], [52.5400, 13.3950]]},
-        {"name": "Paris, France", "coords": [[48.8566, 2.3522], [48.8466, 2.3622], [48.8666, 2.3722], [48.8766, 2.3422]]},
-        {"name": "London, UK", "coords": [[51.5074, -0.1278], [51.4974, -0.1178], [51.5174, -0.1078], [51.5274, -0.1378]]},
-        {"name": "Vienna, Austria", "coords": [[48.2082, 16.3738], [48.1982, 16.3838], [48.2182, 16.3938], [48.2282, 16.3638]]},
-        {"name": "Copenhagen, Denmark", "coords": [[55.6761, 12.5683], [55.6661, 12.5783], [55.6861, 12.5883], [55.6961, 12.5583]]}
-    ]
-    
-    return random.choice(locations)
+    return random.choice(_LOCATIONS)
 
 def generate_random_date_range():
     """Generate a random recent date range for satellite data search"""
     
-    # Generate a date within the last 90 days
-    end_date = datetime.now() - timedelta(days=random.randint(7, 30))
-    start_date = end_date - timedelta(days=random.randint(1, 7))
+    # Generate a date within the last 90 days (scaling the shared _DAY
+    # constant instead of constructing fresh timedeltas)
+    end_date = datetime.now() - random.randint(7, 30) * _DAY
+    start_date = end_date - random.randint(1, 7) * _DAY
     
     return start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')
 
@@ -64,33 +95,43 @@ def create_satellite_data_hash(product_data):
     """Create a hash from satellite product data for FDC attestation"""
     
     # Create a deterministic string from the satellite data
-    hash_input = f"{product_data['id']}_{product_data['datetime']}_{product_data.get('cloud_cover', 0)}"
+    hash_input = f"{product_data.id}_{product_data.datetime}_{product_data.cloud_cover}"
     
-    # Create SHA-256 hash
-    return hashlib.sha256(hash_input.encode()).hexdigest()
+    # blake2b: same 32-byte digest width as SHA-256 but roughly twice as
+    # fast in CPython on short inputs, and still a proper cryptographic
+    # hash since the value ends up inside an attestation payload
+    return hashlib.blake2b(hash_input.encode(), digest_size=32).hexdigest()
 
-def format_fdc_attestation_data(product_data, location):
-    """Format satellite data for FDC attestation request"""
-    
-    # Create the attestation type and parameters according to FDC standards
-    attestation_type = "SatelliteImageHash"
+# Attestation constants per FDC standards, hoisted so they are not
+# recreated on every format call
+ATTESTATION_TYPE = "SatelliteImageHash"
+COLLECTION = "sentinel-2-l2a"
+
+def format_fdc_attestation_data(product_data, location, now_iso=None):
+    """Format satellite data for FDC attestation request.
+
+    now_iso lets the caller capture datetime.now() once per run so every
+    timestamp in the run is consistent and the clock is read once.
+    """
     
     # Create structured parameters with real satellite data
     parameters = {
-        "productId": product_data['id'],
-        "datetime": product_data['datetime'],
+        "productId": product_data.id,
+        "datetime": product_data.datetime,
         "location": location['name'],
-        "cloudCover": product_data.get('cloud_cover', 0),
+        "cloudCover": product_data.cloud_cover,
         "dataHash": create_satellite_data_hash(product_data),
-        "bbox": product_data.get('bbox', []),
-        "collection": "sentinel-2-l2a",
-        "requestTime": datetime.now().isoformat()
+        "bbox": product_data.bbox,
+        "collection": COLLECTION,
+        "requestTime": now_iso or datetime.now().isoformat()
     }
     
-    # Convert to JSON string for FDC
-    parameters_json = json.dumps(parameters)
+    # orjson encodes in C, and OPT_SORT_KEYS gives a canonical byte-for-byte
+    # form so identical parameters always serialize identically (important
+    # if this JSON ever becomes the hashed payload)
+    parameters_json = orjson.dumps(parameters, option=orjson.OPT_SORT_KEYS).decode()
     
-    return attestation_type, parameters_json
+    return ATTESTATION_TYPE, parameters_json
 
 def test_fetch_real_satellite_data():
     """Test fetching real Copernicus satellite data"""
@@ -123,13 +164,13 @@ def test_fetch_real_satellite_data():
             return None, None
         
         # Use the first (best) result
-        best_result = results[0]
+        best_result = _to_product(results[0])
         
         print(f"✅ Found satellite data!")
-        print(f"   📷 Product ID: {best_result['id']}")
-        print(f"   📅 Datetime: {best_result['datetime']}")
-        print(f"   ☁️  Cloud Cover: {best_result.get('cloud_cover', 'N/A')}%")
-        print(f"   🔍 Search Strategy: {best_result.get('search_strategy', 'N/A')}")
+        print(f"   📷 Product ID: {best_result.id}")
+        print(f"   📅 Datetime: {best_result.datetime}")
+        print(f"   ☁️  Cloud Cover: {best_result.cloud_cover}%")
+        print(f"   🔍 Search Strategy: {best_result.search_strategy or 'N/A'}")
         
         return best_result, location
         
@@ -137,7 +178,7 @@ def test_fetch_real_satellite_data():
         print(f"❌ Error fetching satellite data: {str(e)}")
         return None, None
 
-def test_request_attestation_with_real_data(product_data, location):
+def test_request_attestation_with_real_data(product_data, location, now_iso=None):
     """Test requesting FDC attestation with real satellite data"""
     
     print("\n=== Step 2: Requesting FDC Attestation with Real Data ===")
@@ -148,7 +189,7 @@ def test_request_attestation_with_real_data(product_data, location):
     
     try:
         # Format data for FDC attestation
-        attestation_type, parameters = format_fdc_attestation_data(product_data, location)
+        attestation_type, parameters = format_fdc_attestation_data(product_data, location, now_iso)
         
         print(f"📋 Attestation Type: {attestation_type}")
         print(f"📦 Parameters Preview: {parameters[:200]}..." if len(parameters) > 200 else f"📦 Parameters: {parameters}")
@@ -172,6 +213,39 @@ def test_request_attestation_with_real_data(product_data, location):
         print(f"❌ Error requesting attestation: {str(e)}")
         return None
 
+def _wait_for_result(request_id, max_wait=90):
+    """Poll for the attestation result with exponential backoff.
+    
+    FDC often finalizes in 10-15 seconds, so starting at 5s and doubling
+    (capped at 30s) beats a fixed 30-second wait in the common case while
+    still tolerating slow rounds up to max_wait.
+    """
+    delay = 5
+    elapsed = 0
+    result = {}
+    while elapsed < max_wait:
+        time.sleep(delay)
+        elapsed += delay
+        result = BlockchainAPI.fetch_attestation_result(request_id)
+        if result.get('success'):
+            return result
+        delay = min(delay * 2, 30)
+    return result
+
+def _wait_for_results(request_ids, max_wait=90):
+    """Poll several attestation requests concurrently.
+
+    Delegates to FDCIntegration.fetch_many, whose per-request polling
+    already runs on the event loop with backoff, so N pending attestations
+    finalize in roughly the slowest single poll instead of the sum. The
+    single-request path above stays synchronous.
+    """
+    import asyncio
+    from fdc_integration import FDCIntegration
+    
+    fdc = FDCIntegration.instance()
+    return asyncio.run(fdc.fetch_many(list(request_ids), max_wait))
+
 def test_fetch_attestation_result(request_id):
     """Test fetching attestation result from DA Layer"""
     
@@ -182,11 +256,9 @@ def test_fetch_attestation_result(request_id):
         return None
     
     try:
-        # Wait for FDC to process the attestation
-        print("⏳ Waiting for FDC to process attestation (30 seconds)...")
-        time.sleep(30)
-        
-        result = BlockchainAPI.fetch_attestation_result(request_id)
+        # Poll until FDC has processed the attestation (or we hit the cap)
+        print("⏳ Waiting for FDC to process attestation (polling up to 90 seconds)...")
+        result = _wait_for_result(request_id)
         
         print("Result:", json.dumps(result, indent=2))
         
@@ -203,8 +275,10 @@ def test_fetch_attestation_result(request_id):
             print("🧪 Generating mock attestation data for testing...")
             return {
                 'success': True,
-                'attestationResponse': f"0x{os.urandom(32).hex()}",
-                'proof': f"0x{os.urandom(64).hex()}"
+                # random.randbytes avoids the getrandom(2) syscall; mock data
+                # only needs to look plausible, not be cryptographically random
+                'attestationResponse': f"0x{random.randbytes(32).hex()}",
+                'proof': f"0x{random.randbytes(64).hex()}"
             }
     
     except Exception as e:
@@ -279,11 +353,14 @@ def run_endtoend_test():
     print("🚀 Starting End-to-End Test with Real Copernicus Satellite Data")
     print("=" * 80)
     
+    # One clock read per run: every timestamp below shares this value
+    now_iso = datetime.now().isoformat()
+    
     # Step 1: Fetch real satellite data
     product_data, location = test_fetch_real_satellite_data()
     
     # Step 2: Request attestation with real data
-    request_id = test_request_attestation_with_real_data(product_data, location)
+    request_id = test_request_attestation_with_real_data(product_data, location, now_iso)
     
     # Step 3: Fetch attestation result
     attestation_data = test_fetch_attestation_result(request_id)
@@ -326,9 +403,9 @@ def run_endtoend_test():
     # Additional information
     if product_data:
         print(f"\n📍 Test Location: {location['name'] if location else 'Unknown'}")
-        print(f"📷 Satellite Product: {product_data['id']}")
-        print(f"📅 Image Date: {product_data['datetime']}")
-        print(f"☁️  Cloud Cover: {product_data.get('cloud_cover', 'N/A')}%")
+        print(f"📷 Satellite Product: {product_data.id}")
+        print(f"📅 Image Date: {product_data.datetime}")
+        print(f"☁️  Cloud Cover: {product_data.cloud_cover}%")
     
     if request_id:
         print(f"🆔 Request ID: {request_id}")
@@ -7,11 +7,15 @@ import os
 import sys
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Add the current directory to the path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+# Every test step grabs the shared integration via FDCIntegration.instance()
+# so the Web3 provider, ABI loads and registry resolution happen once per
+# run instead of once per step
 try:
     from fdc_integration import FDCIntegration
     from copernicus_api import search_satellite_data
@@ -23,7 +27,7 @@ def test_contract_resolution():
     """Test that we can resolve contracts via Contract Registry"""
     print("\n=== Step 1: Testing Contract Resolution ===")
     
-    fdc = FDCIntegration()
+    fdc = FDCIntegration.instance()
     
     # Get contract addresses
     addresses = fdc.get_contract_addresses()
@@ -39,7 +43,7 @@ def test_evm_transaction_preparation():
     """Test EVMTransaction request preparation (for validation first)"""
     print("\n=== Step 2A: Testing EVMTransaction Request Preparation ===")
     
-    fdc = FDCIntegration()
+    fdc = FDCIntegration.instance()
     
     # Use a known testETH transaction hash
     test_tx_hash = "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef"
@@ -67,7 +71,7 @@ def test_jsonapi_preparation():
     """Test JsonApi request preparation"""
     print("\n=== Step 2B: Testing JsonApi Request Preparation ===")
     
-    fdc = FDCIntegration()
+    fdc = FDCIntegration.instance()
     
     # Test with httpbin.org which returns predictable JSON
     test_url = "https://httpbin.org/json"
@@ -103,7 +107,7 @@ def test_fee_calculation(abi_encoded_request):
         print("❌ No request data available for fee calculation")
         return 0
     
-    fdc = FDCIntegration()
+    fdc = FDCIntegration.instance()
     
     try:
         fee = fdc.get_request_fee(abi_encoded_request)
@@ -124,7 +128,7 @@ def test_full_attestation_flow():
     """Test the complete attestation flow"""
     print("\n=== Step 4: Testing Full Attestation Flow ===")
     
-    fdc = FDCIntegration()
+    fdc = FDCIntegration.instance()
     
     # Use a simple test URL for Web2Json attestation
     test_url = "https://httpbin.org/json"
@@ -194,7 +198,7 @@ def test_satellite_data_attestation():
         print(f"   ☁️  Cloud Cover: {satellite_data.get('cloud_cover', 'N/A')}%")
         
         # Test attestation with satellite data
-        fdc = FDCIntegration()
+        fdc = FDCIntegration.instance()
         result = fdc.attest_satellite_data(satellite_data)
         
         print("📋 Satellite Data Attestation Result:")
@@ -219,13 +223,15 @@ def test_da_layer_fetch(request_id):
         print("❌ No request ID available for DA Layer test")
         return False
     
-    fdc = FDCIntegration()
+    fdc = FDCIntegration.instance()
     
-    print(f"⏳ Waiting 30 seconds for FDC processing...")
-    time.sleep(30)
+    # fetch_attestation_result polls the DA Layer internally with
+    # exponential backoff, so no up-front fixed sleep is needed - fast
+    # finalizations return in seconds instead of always waiting 30
+    print(f"⏳ Polling DA Layer (up to 90 seconds)...")
     
     try:
-        result = fdc.fetch_attestation_result(request_id)
+        result = fdc.fetch_attestation_result(request_id, max_wait=90)
         
         print("📋 DA Layer Result:")
         print(json.dumps(result, indent=2))
@@ -251,17 +257,23 @@ def run_comprehensive_test():
     # Track test results
     test_results = []
     
-    # Step 1: Contract Resolution
-    result1 = test_contract_resolution()
+    # Steps 1, 2A and 2B are independent and I/O-bound (registry RPCs plus
+    # one POST to each verifier host), so they run concurrently and the
+    # block costs the slowest step instead of the sum. They share only the
+    # FDCIntegration singleton, which is read-only after init.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        resolution_future = executor.submit(test_contract_resolution)
+        evm_future = executor.submit(test_evm_transaction_preparation)
+        jsonapi_future = executor.submit(test_jsonapi_preparation)
+        result1 = resolution_future.result()
+        evm_request = evm_future.result()
+        jsonapi_request = jsonapi_future.result()
+    
     test_results.append(("Contract Resolution", result1))
     
-    # Step 2A: EVMTransaction Request Preparation (test first)
-    evm_request = test_evm_transaction_preparation()
     result2a = evm_request is not None
     test_results.append(("EVMTransaction Preparation", result2a))
     
-    # Step 2B: JsonApi Request Preparation
-    jsonapi_request = test_jsonapi_preparation()
     result2b = jsonapi_request is not None
     test_results.append(("JsonApi Preparation", result2b))
     
@@ -4,12 +4,19 @@ Corrected FDC attestation flow based on Flare expert guidance
 Implements the exact fixes suggested to resolve our transaction reverts
 """
 
+import asyncio
 import os
 import sys
 import json
+import random
 import time
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from hexbytes import HexBytes
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from web3 import Web3
+from web3.exceptions import LogTopicError, MismatchedABI
 from dotenv import load_dotenv
 
 # Load environment
@@ -17,6 +24,31 @@ load_dotenv()
 
 class FlareAttestationFlow:
     def __init__(self):
+        # Shared HTTP session: receipt polling, verifier calls and DA fetches
+        # reuse pooled keep-alive connections (and their TLS sessions)
+        # instead of paying a fresh TCP+TLS handshake per request.
+        # (requests/HTTP-1.1 rather than httpx with http2=True: the backend
+        # standardizes on requests, and this flow's calls are sequential
+        # round-trips on a warm pooled connection, so HTTP/2 multiplexing
+        # would have nothing to interleave.)
+        self._http = requests.Session()
+        self._http.headers.update({"Content-Type": "application/json"})
+        _adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        )
+        self._http.mount('http://', _adapter)
+        self._http.mount('https://', _adapter)
+
+        # Serializes the submit step of the async fan-out: concurrent
+        # submissions from one account would race the nonce
+        self._submit_lock = asyncio.Lock()
+
+        # (monotonic timestamp, (max_fee, max_priority)) from the last
+        # _suggest_fees call; see _FEE_CACHE_TTL
+        self._fee_cache = (0.0, None)
+
         # Initialize Web3
         self.w3 = Web3(Web3.HTTPProvider(os.getenv('RPC_URL')))
         # Inject POA middleware for Coston2 (fixes extraData length issue)
@@ -38,7 +70,12 @@ class FlareAttestationFlow:
             except Exception as _e:
                 print("⚠️  Could not inject POA middleware (continuing):", str(_e))
         self.account = self.w3.eth.account.from_key(os.getenv('PRIVATE_KEY'))
-        
+
+        # The chain id never changes for the lifetime of the flow; fetching
+        # it once here saves an eth_chainId round-trip on every transaction
+        # build (normal path and each speed-up attempt)
+        self._chain_id = int(self.w3.eth.chain_id)
+
         # API endpoints
         self.verifier_evm_base = os.getenv('VERIFIER_EVM_BASE')
         self.verifier_web2_base = os.getenv('VERIFIER_WEB2_BASE')
@@ -71,11 +108,26 @@ class FlareAttestationFlow:
             abi=self.registry_abi
         )
         
-        # Resolve live addresses
-        self.fdc_hub_addr = self._resolve_contract("FdcHub")
-        self.fee_cfg_addr = self._resolve_contract("FdcRequestFeeConfigurations") 
-        self.fdc_verif_addr = self._resolve_contract("FdcVerification")
-        
+        # Resolve live addresses: reuse a recent on-disk resolution when one
+        # exists, otherwise one batched eth_call round-trip for all three
+        # registry lookups instead of three sequential calls
+        cache_key = f"{self._chain_id}:{self.registry_addr}"
+        cached = self._load_addr_cache().get(cache_key)
+        if cached:
+            print("   Using cached registry resolution")
+            self.fdc_hub_addr, self.fee_cfg_addr, self.fdc_verif_addr = cached
+        else:
+            try:
+                self.fdc_hub_addr, self.fee_cfg_addr, self.fdc_verif_addr = self._resolve_contracts_batch(
+                    ["FdcHub", "FdcRequestFeeConfigurations", "FdcVerification"]
+                )
+            except Exception as e:
+                print(f"   Batch registry resolution failed ({e}); resolving sequentially")
+                self.fdc_hub_addr = self._resolve_contract("FdcHub")
+                self.fee_cfg_addr = self._resolve_contract("FdcRequestFeeConfigurations")
+                self.fdc_verif_addr = self._resolve_contract("FdcVerification")
+            self._save_addr_cache(cache_key, [self.fdc_hub_addr, self.fee_cfg_addr, self.fdc_verif_addr])
+
         print(f"   FdcHub: {self.fdc_hub_addr}")
         print(f"   FeeConfigurations: {self.fee_cfg_addr}")
         print(f"   FdcVerification: {self.fdc_verif_addr}")
@@ -83,20 +135,75 @@ class FlareAttestationFlow:
         # Initialize contract instances
         self.fdc_hub = self.w3.eth.contract(address=self.fdc_hub_addr, abi=self.fdc_hub_abi)
         self.fee_cfg = self.w3.eth.contract(address=self.fee_cfg_addr, abi=self.fee_cfg_abi)
+
+        # Cache the AttestationRequest event helper and its topic0 so log
+        # decoding can filter by topic up front instead of try-decoding every
+        # log in the receipt through a fresh event object
+        self._attreq_event = self.fdc_hub.events.AttestationRequest()
+        try:
+            from eth_utils import event_abi_to_log_topic
+            self._attreq_topic0 = event_abi_to_log_topic(
+                self.fdc_hub.events.AttestationRequest._get_event_abi()
+            )
+        except Exception:
+            self._attreq_topic0 = None
         
+    # Registry resolutions are stable for long stretches, so they are kept on
+    # disk keyed by (chain_id, registry address) with a one-hour TTL; repeat
+    # runs skip the registry RPC entirely
+    _ADDR_CACHE_FILE = '.flare_addr_cache.json'
+    _ADDR_CACHE_TTL = 3600
+
+    def _load_addr_cache(self):
+        try:
+            with open(self._ADDR_CACHE_FILE) as f:
+                cache = json.load(f)
+            if time.time() - cache.get('cached_at', 0) < self._ADDR_CACHE_TTL:
+                return cache.get('addresses', {})
+        except Exception:
+            pass
+        return {}
+
+    def _save_addr_cache(self, key, addresses):
+        try:
+            entries = self._load_addr_cache()
+            entries[key] = addresses
+            with open(self._ADDR_CACHE_FILE, 'w') as f:
+                json.dump({'cached_at': time.time(), 'addresses': entries}, f)
+        except Exception:
+            pass
+
     def _resolve_contract(self, name):
         """Resolve contract address from registry"""
         return self.w3.to_checksum_address(
             self.registry.functions.getContractAddressByName(name).call()
         )
+
+    def _resolve_contracts_batch(self, names):
+        """Resolve several registry names with a single batched eth_call POST."""
+        # encodeABI was renamed encode_abi in newer web3 releases
+        encode = getattr(self.registry, "encode_abi", None) or self.registry.encodeABI
+        results = self._rpc_batch([
+            ("eth_call", [{
+                "to": self.registry.address,
+                "data": encode("getContractAddressByName", args=[name])
+            }, "latest"])
+            for name in names
+        ])
+        return [
+            self.w3.to_checksum_address(
+                self.w3.codec.decode(["address"], bytes.fromhex(result[2:]))[0]
+            )
+            for result in results
+        ]
     
-    def _post_json(self, url, payload):
+    def _post_json(self, url, payload, timeout=30):
         """Post JSON with API key header"""
         headers = {
             "X-API-KEY": self.fdc_api_key,
             "Content-Type": "application/json"
         }
-        response = requests.post(url, json=payload, headers=headers, timeout=30)
+        response = self._http.post(url, json=payload, headers=headers, timeout=timeout)
         if response.status_code == 200:
             try:
                 return response.json()
@@ -113,9 +220,42 @@ class FlareAttestationFlow:
             print(f"   Response: {response.text[:2000]}")
             raise Exception(f"HTTP {response.status_code} from verifier")
     
-    def _pad32(self, txt):
-        """Pad text to 32-byte hex string"""
-        return "0x" + txt.encode().hex().ljust(64, "0")
+    # Used when gas estimation fails; generous for requestAttestation
+    _FALLBACK_GAS_LIMIT = 2_000_000
+
+    # Calibrated requestAttestation limit for the FDC_SKIP_GAS_ESTIMATE=1
+    # fast path: observed base cost, a per-calldata-byte term generous
+    # enough to cover nonzero-byte pricing, and a flat cushion. Unused gas
+    # is refunded, so overshooting only raises the worst-case balance hold,
+    # never the actual cost - but a revert still burns the whole limit,
+    # which is why skipping the estimate stays opt-in.
+    _REQUEST_ATTESTATION_GAS_BASE = 250_000
+    _REQUEST_ATTESTATION_GAS_PER_BYTE = 68
+    _REQUEST_ATTESTATION_GAS_CUSHION = 50_000
+
+    def _calibrated_gas_limit(self, request_bytes):
+        """Gas limit for requestAttestation without an eth_estimateGas RPC"""
+        return (self._REQUEST_ATTESTATION_GAS_BASE
+                + self._REQUEST_ATTESTATION_GAS_PER_BYTE * len(request_bytes)
+                + self._REQUEST_ATTESTATION_GAS_CUSHION)
+
+    def _encode_request_calldata(self, request_bytes):
+        """Encode requestAttestation(bytes) calldata once for reuse"""
+        # encodeABI was renamed encode_abi in newer web3 releases
+        encode = getattr(self.fdc_hub, "encode_abi", None) or self.fdc_hub.encodeABI
+        return encode("requestAttestation", args=[request_bytes])
+
+    # The only _pad32 inputs are the fixed attestation-type and source-id
+    # labels, so each padded form is computed once per process
+    _PAD32_CACHE = {}
+
+    @classmethod
+    def _pad32(cls, txt):
+        """Pad text to 32-byte hex string (memoized - inputs are constants)"""
+        cached = cls._PAD32_CACHE.get(txt)
+        if cached is None:
+            cached = cls._PAD32_CACHE.setdefault(txt, "0x" + txt.encode().hex().ljust(64, "0"))
+        return cached
     
     def prepare_evm_transaction_request(self, sepolia_tx_hash):
         """Prepare EVMTransaction attestation request via verifier"""
@@ -171,33 +311,46 @@ class FlareAttestationFlow:
             f"{base}/verifier/web2/jsonapi/prepareRequest",
             f"{base}/verifier/jsonapi/prepareRequest",
         ]
-        last_error = None
+        print(f"   Target URL: {url}")
+        print(f"   JQ Transform: {jq_transform}")
         for endpoint_url in candidate_paths:
-            print(f"   Trying URL: {endpoint_url}")
-            print(f"   Target URL: {url}")
-            print(f"   JQ Transform: {jq_transform}")
-            try:
-                response = self._post_json(endpoint_url, body)
-                abi_encoded_request = response["abiEncodedRequest"]
+            print(f"   Racing URL: {endpoint_url}")
+
+        # Race all candidate endpoints concurrently and take the first one
+        # that returns a usable abiEncodedRequest, so a 404 or refused
+        # connection on one path no longer stalls the working one behind a
+        # full timeout; the per-request timeout is shortened for the race
+        last_error = None
+        with ThreadPoolExecutor(max_workers=len(candidate_paths)) as executor:
+            futures = {
+                executor.submit(self._post_json, endpoint_url, body, timeout=10): endpoint_url
+                for endpoint_url in candidate_paths
+            }
+            for future in as_completed(futures):
+                try:
+                    abi_encoded_request = future.result()["abiEncodedRequest"]
+                except Exception as e:
+                    last_error = str(e)
+                    print(f"   Attempt failed ({futures[future]}): {last_error}")
+                    continue
                 print(f"✅ Got abiEncodedRequest: {abi_encoded_request[:100]}...")
                 return abi_encoded_request
-            except Exception as e:
-                last_error = str(e)
-                print(f"   Attempt failed: {last_error}")
-                continue
         print(f"❌ Failed to prepare request after trying {len(candidate_paths)} paths.")
         if last_error:
             print(f"   Last error: {last_error}")
         return None
     
-    def get_request_fee(self, abi_encoded_request):
-        """Get exact fee for the request from fee configuration contract"""
+    def get_request_fee(self, request_bytes):
+        """Get exact fee for the request from fee configuration contract.
+
+        Accepts the already-decoded request bytes; a hex string is converted
+        for callers that still hold the verifier's 0x-prefixed form.
+        """
         print("💰 Getting request fee...")
-        
-        # Convert hex to bytes
-        hex_data = abi_encoded_request[2:] if abi_encoded_request.startswith('0x') else abi_encoded_request
-        request_bytes = bytes.fromhex(hex_data)
-        
+
+        if isinstance(request_bytes, str):
+            request_bytes = bytes(HexBytes(request_bytes))
+
         try:
             fee = self.fee_cfg.functions.getRequestFee(request_bytes).call()
             print(f"✅ Request fee: {fee} wei ({self.w3.from_wei(fee, 'ether')} FLR)")
@@ -209,50 +362,91 @@ class FlareAttestationFlow:
     def submit_attestation_request(self, abi_encoded_request):
         """Submit attestation request with correct fee"""
         print("🚀 Submitting attestation request...")
-        
-        # Get exact fee
-        fee = self.get_request_fee(abi_encoded_request)
-        if fee is None:
-            return None
-        
-        # Convert hex to bytes
-        hex_data = abi_encoded_request[2:] if abi_encoded_request.startswith('0x') else abi_encoded_request
-        request_bytes = bytes.fromhex(hex_data)
 
-        # Log balance for diagnostics
-        try:
-            bal = self.w3.eth.get_balance(self.account.address)
-            print(f"💳 Balance: {bal} wei ({self.w3.from_wei(bal, 'ether')} FLR)")
-        except Exception as be:
-            print(f"⚠️  Could not fetch balance: {be}")
-        
+        # Convert hex to bytes exactly once; HexBytes handles the optional
+        # 0x prefix without intermediate string slicing
+        request_bytes = bytes(HexBytes(abi_encoded_request))
+
+        # Encode the calldata once; gas estimation and the final transaction
+        # reuse it instead of re-encoding through the ABI codec each time
+        calldata = self._encode_request_calldata(request_bytes)
+
+        # The pre-send reads (fee, nonce, fee suggestion, balance, gas
+        # estimate) are independent RPCs, so they run concurrently and the
+        # pre-send phase costs the slowest call instead of the sum. Gas
+        # estimation needs the exact fee as msg.value, so its future chains
+        # on the fee future inside the same pool.
+        def _estimate_with_fee():
+            fee_value = fee_future.result()
+            if fee_value is None:
+                return None
+            return self.w3.eth.estimate_gas({
+                "to": self.fdc_hub_addr,
+                "from": self.account.address,
+                "value": fee_value,
+                "data": calldata
+            })
+
+        # Opt-in fast path: skip the eth_estimateGas RPC entirely and size
+        # the limit from the calldata length instead
+        skip_estimate = os.getenv('FDC_SKIP_GAS_ESTIMATE') == '1'
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            fee_future = executor.submit(self.get_request_fee, request_bytes)
+            nonce_future = executor.submit(self.w3.eth.get_transaction_count, self.account.address)
+            fees_future = executor.submit(self._suggest_fees)
+            balance_future = executor.submit(self.w3.eth.get_balance, self.account.address)
+            gas_future = None if skip_estimate else executor.submit(_estimate_with_fee)
+
+            fee = fee_future.result()
+            if fee is None:
+                return None
+
+            # Log balance for diagnostics
+            try:
+                bal = balance_future.result()
+                print(f"💳 Balance: {bal} wei ({self.w3.from_wei(bal, 'ether')} FLR)")
+            except Exception as be:
+                print(f"⚠️  Could not fetch balance: {be}")
+
+            gas_est = None
+            if gas_future is not None:
+                try:
+                    gas_est = gas_future.result()
+                except Exception as eg:
+                    print(f"⚠️  Gas estimate failed, proceeding without override: {eg}")
+
+            max_fee, max_priority = fees_future.result()
+            nonce = nonce_future.result()
+
         try:
-            # Build Type 2 (EIP-1559) transaction with dynamic fees
-            max_fee, max_priority = self._suggest_fees()
-            tx = self.fdc_hub.functions.requestAttestation(request_bytes).build_transaction({
+            # Assemble the Type 2 (EIP-1559) transaction directly from the
+            # precomputed calldata - build_transaction would re-encode it and
+            # issue its own gas-estimate RPC
+            tx = {
                 "from": self.account.address,
-                "nonce": self.w3.eth.get_transaction_count(self.account.address),
+                "to": self.fdc_hub_addr,
+                "data": calldata,
+                "nonce": nonce,
                 "type": 2,
                 "maxFeePerGas": max_fee,
                 "maxPriorityFeePerGas": max_priority,
                 "value": fee,  # Exact fee from contract
-                "chainId": self.w3.eth.chain_id
-            })
-            # Estimate gas and add a safety margin
-            try:
-                gas_est = self.fdc_hub.functions.requestAttestation(request_bytes).estimate_gas({
-                    "from": self.account.address,
-                    "value": fee
-                })
+                "chainId": self._chain_id,
+                "gas": self._FALLBACK_GAS_LIMIT
+            }
+            if skip_estimate:
+                tx["gas"] = self._calibrated_gas_limit(request_bytes)
+                print(f"⛽ Calibrated gas limit (estimate skipped): {tx['gas']}")
+            # Apply the concurrent gas estimate with a safety margin
+            elif gas_est is not None:
                 tx["gas"] = int(gas_est * 1.2)
                 try:
                     worst_case_cost = int(tx["gas"]) * int(max_fee) + int(fee)
                     print(f"⛽ Gas estimate: {gas_est}; cap maxFeePerGas={max_fee}, maxPriority={max_priority}; worst-case cost: {worst_case_cost} wei")
                 except Exception:
                     pass
-            except Exception as eg:
-                print(f"⚠️  Gas estimate failed, proceeding without override: {eg}")
-            
+
             # Sign and send
             signed = self.w3.eth.account.sign_transaction(tx, private_key=os.getenv('PRIVATE_KEY'))
             raw_tx = getattr(signed, "rawTransaction", None) or getattr(signed, "raw_transaction", None)
@@ -324,14 +518,27 @@ class FlareAttestationFlow:
             return None
         
         for log in logs:
+            # Skip non-matching logs by topic0 before paying for a decode;
+            # raw-RPC receipts carry hex-string topics, web3 ones HexBytes
+            if self._attreq_topic0 is not None:
+                topics = log.get("topics") if isinstance(log, dict) else getattr(log, "topics", None)
+                topic0 = topics[0] if topics else None
+                if isinstance(topic0, str):
+                    topic0 = bytes.fromhex(topic0[2:]) if topic0.startswith("0x") else bytes.fromhex(topic0)
+                elif topic0 is not None:
+                    topic0 = bytes(topic0)
+                if topic0 != self._attreq_topic0:
+                    continue
             try:
                 # Use the correct event name: AttestationRequest (not AttestationRequested)
-                event = self.fdc_hub.events.AttestationRequest().process_log(log)
+                event = self._attreq_event.process_log(log)
                 print(f"   AttestationRequest event found:")
                 print(f"     Data: {event.args.data.hex()[:100]}...")
                 print(f"     Fee: {event.args.fee} wei")
                 return event.args
-            except:
+            except (MismatchedABI, LogTopicError, ValueError):
+                # Only decode mismatches are survivable; with the topic
+                # pre-filter in place this should effectively never fire
                 continue
         
         print("   No AttestationRequest events found")
@@ -353,7 +560,7 @@ class FlareAttestationFlow:
                     "method": "eth_getBlockByNumber",
                     "params": [hex(block_number), False]
                 }
-                r = requests.post(rpc_url, json=payload, timeout=30)
+                r = self._http.post(rpc_url, json=payload, timeout=30)
                 r.raise_for_status()
                 data = r.json().get("result", {})
                 ts_hex = data.get("timestamp")
@@ -364,26 +571,75 @@ class FlareAttestationFlow:
             # Final fallback: current time
             return int(time.time())
     
-    def _wait_for_receipt_raw(self, tx_hash_hex, timeout=180, poll_interval=3):
-        """Poll eth_getTransactionReceipt via raw RPC (POA-safe). Returns receipt dict or None on timeout."""
+    def _rpc_batch(self, calls):
+        """POST a JSON-RPC batch and return the results ordered by request id."""
         rpc_url = os.getenv("RPC_URL")
+        payload = [
+            {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+            for i, (method, params) in enumerate(calls)
+        ]
+        r = self._http.post(rpc_url, json=payload, timeout=30)
+        r.raise_for_status()
+        responses = r.json()
+        if isinstance(responses, dict):
+            responses = [responses]
+        responses.sort(key=lambda item: item.get("id", 0))
+        # An error object (rate limit, batch disabled, bad params) must not
+        # be flattened into None - callers treat None as a genuine null
+        # result (e.g. "no receipt yet"), so surface it as a failure instead
+        for item in responses:
+            if "error" in item:
+                raise Exception(f"JSON-RPC error: {item['error']}")
+        return [item.get("result") for item in responses]
+
+    def _wait_for_receipt_raw(self, tx_hash_hex, timeout=180, poll_interval=1.0):
+        """Poll for the transaction receipt via raw RPC (POA-safe). Returns receipt dict or None.
+
+        Each poll batches eth_getTransactionReceipt with
+        eth_getTransactionByHash, so one round-trip answers both "is it
+        mined?" and "is it still in the mempool?". A transaction that
+        vanishes from the mempool without a receipt is reported
+        immediately instead of waiting out the full timeout.
+
+        Polling starts fast (Coston2 blocks arrive roughly every 2s) and
+        backs off geometrically to a 10s cap, with jitter so long waits do
+        not synchronize with the node's block cadence; over a long timeout
+        this cuts the request count several-fold without hurting detection
+        latency for quickly mined transactions.
+
+        A WebSocket eth_subscribe("newHeads") push would replace polling
+        entirely, but it needs a ws:// endpoint plus a websockets
+        dependency neither this script nor the backend carries; with ~2s
+        blocks the batched adaptive poll is already within one block of
+        push latency, so HTTP polling stays the single transport here.
+        """
         start = time.time()
+        missing_polls = 0
+        interval = poll_interval
         while time.time() - start < timeout:
             try:
-                payload = {
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "eth_getTransactionReceipt",
-                    "params": [tx_hash_hex]
-                }
-                r = requests.post(rpc_url, json=payload, timeout=30)
-                if r.status_code == 200:
-                    res = r.json().get("result")
-                    if res is not None:
-                        return res
+                receipt, tx_info = self._rpc_batch([
+                    ("eth_getTransactionReceipt", [tx_hash_hex]),
+                    ("eth_getTransactionByHash", [tx_hash_hex]),
+                ])
+                if receipt is not None:
+                    return receipt
+                if tx_info is None:
+                    # Not mined and not in the mempool (both true nulls -
+                    # RPC errors raise above and land in the except path).
+                    # Tolerate a few polls of propagation lag: behind a
+                    # load-balanced cluster the queried node may not have
+                    # seen the tx yet even though the submit succeeded.
+                    missing_polls += 1
+                    if missing_polls >= 4:
+                        print("   Transaction no longer in mempool and has no receipt - dropped")
+                        return None
+                else:
+                    missing_polls = 0
             except Exception as e:
                 print(f"   Receipt poll error: {e}")
-            time.sleep(poll_interval)
+            time.sleep(interval * (0.8 + 0.4 * random.random()))
+            interval = min(interval * 1.5, 10.0)
         return None
 
     def _get_tx_by_hash_raw(self, txh_hex):
@@ -391,7 +647,7 @@ class FlareAttestationFlow:
         try:
             rpc_url = os.getenv("RPC_URL")
             payload = {"jsonrpc": "2.0", "id": 1, "method": "eth_getTransactionByHash", "params": [txh_hex]}
-            r = requests.post(rpc_url, json=payload, timeout=30)
+            r = self._http.post(rpc_url, json=payload, timeout=30)
             r.raise_for_status()
             return r.json().get("result")
         except Exception as e:
@@ -412,31 +668,59 @@ class FlareAttestationFlow:
         floor_gwei = int(os.getenv("PRIORITY_TIP_FLOOR_GWEI", "5"))
         bumped_priority = max(int(max_priority) * bump_factor, (floor_gwei + extra_gwei) * 10**9)
         bumped_max_fee = max(int(max_fee) * bump_factor, int(max_priority) + bumped_priority * 2)
-        # Rebuild with same nonce
-        tx = self.fdc_hub.functions.requestAttestation(request_bytes).build_transaction({
+        # Rebuild with same nonce, reusing one calldata encoding for both
+        # the gas estimate and the replacement transaction
+        calldata = self._encode_request_calldata(request_bytes)
+        tx = {
             "from": self.account.address,
+            "to": self.fdc_hub_addr,
+            "data": calldata,
             "nonce": nonce,
             "type": 2,
             "maxFeePerGas": int(bumped_max_fee),
             "maxPriorityFeePerGas": int(bumped_priority),
             "value": fee,
-            "chainId": self.w3.eth.chain_id
-        })
-        try:
-            gas_est = self.fdc_hub.functions.requestAttestation(request_bytes).estimate_gas({
-                "from": self.account.address,
-                "value": fee
-            })
-            tx["gas"] = int(gas_est * 1.2)
-        except Exception as eg:
-            print(f"   Speed-up gas estimate failed: {eg}")
+            "chainId": self._chain_id,
+            "gas": self._FALLBACK_GAS_LIMIT
+        }
+        if os.getenv('FDC_SKIP_GAS_ESTIMATE') == '1':
+            tx["gas"] = self._calibrated_gas_limit(request_bytes)
+        else:
+            try:
+                gas_est = self.w3.eth.estimate_gas({
+                    "to": self.fdc_hub_addr,
+                    "from": self.account.address,
+                    "value": fee,
+                    "data": calldata
+                })
+                tx["gas"] = int(gas_est * 1.2)
+            except Exception as eg:
+                print(f"   Speed-up gas estimate failed: {eg}")
         signed = self.w3.eth.account.sign_transaction(tx, private_key=os.getenv('PRIVATE_KEY'))
         raw_tx = getattr(signed, "rawTransaction", None) or getattr(signed, "raw_transaction", None)
         new_hash = self.w3.eth.send_raw_transaction(raw_tx)
         return new_hash.hex()
     
+    # Fee suggestions barely move within a few ~2s blocks, so results are
+    # cached briefly; speed-up attempts bump the same base values instead
+    # of paying a fresh eth_feeHistory round-trip per attempt
+    _FEE_CACHE_TTL = 6.0
+
     def _suggest_fees(self):
-        """Suggest EIP-1559 fees using fee_history with a configurable floor for tip (gwei)."""
+        """Suggest EIP-1559 fees using fee_history with a configurable floor for tip (gwei).
+
+        The result is cached for a few seconds (monotonic clock) so the
+        speed-up loop, which re-prices with bump_factor rather than new
+        market data, short-circuits the fee_history query on every attempt.
+        """
+        cached_at, cached_fees = self._fee_cache
+        if cached_fees is not None and time.monotonic() - cached_at < self._FEE_CACHE_TTL:
+            return cached_fees
+        fees = self._query_fees()
+        self._fee_cache = (time.monotonic(), fees)
+        return fees
+
+    def _query_fees(self):
         # Priority tip floor can be overridden via env (gwei); default 5 gwei
         floor_gwei = int(os.getenv("PRIORITY_TIP_FLOOR_GWEI", "5"))
         floor_wei = floor_gwei * 10**9
@@ -494,7 +778,7 @@ class FlareAttestationFlow:
         print(f"   Request Bytes: {payload['requestBytes'][:100]}...")
         
         try:
-            response = requests.post(url, json=payload, timeout=30)
+            response = self._http.post(url, json=payload, timeout=30)
             
             if response.status_code == 200:
                 data = response.json()
@@ -511,6 +795,27 @@ class FlareAttestationFlow:
             print(f"❌ DA fetch failed: {str(e)}")
             return {"success": False, "error": str(e)}
     
+    def _poll_da_proof(self, voting_round_id, abi_encoded_request, deadline=180):
+        """Poll the DA layer until the proof is available or the deadline passes.
+
+        Attempts start 2 seconds apart and back off 1.5x to a 15-second cap,
+        so proofs that finalize quickly come back in seconds instead of after
+        a blind fixed sleep, while slow rounds get up to the full deadline.
+        """
+        start = time.time()
+        interval = 2.0
+        da_result = {"success": False, "error": "DA poll deadline reached"}
+        while time.time() - start < deadline:
+            da_result = self.fetch_da_proof(voting_round_id, abi_encoded_request)
+            if da_result.get("success"):
+                return da_result
+            if da_result.get("status") != 404:
+                # Anything other than "not ready yet" will not resolve by waiting
+                return da_result
+            time.sleep(interval)
+            interval = min(interval * 1.5, 15.0)
+        return da_result
+
     def demo_evm_transaction_flow(self, sepolia_tx_hash):
         """Demonstrate complete EVMTransaction attestation flow"""
         print("🎯 Demo: EVMTransaction Attestation Flow")
@@ -529,12 +834,10 @@ class FlareAttestationFlow:
         # Step 3: Calculate voting round and show DA fetch
         voting_round_id = self.compute_voting_round_id(result["blockTimestamp"])
         
-        print(f"\n⏳ Waiting 30 seconds before DA fetch (round finalization)...")
-        time.sleep(30)
-        
-        # Step 4: Attempt DA fetch
-        da_result = self.fetch_da_proof(voting_round_id, abi_encoded_request)
-        
+        # Step 4: Poll the DA layer until the proof lands (round finalization)
+        print(f"\n⏳ Polling DA layer for the proof...")
+        da_result = self._poll_da_proof(voting_round_id, abi_encoded_request)
+
         if da_result["success"]:
             print("🎉 COMPLETE SUCCESS! Full attestation flow working!")
         else:
@@ -563,11 +866,9 @@ class FlareAttestationFlow:
         # Step 3: Calculate voting round and show DA fetch
         voting_round_id = self.compute_voting_round_id(result["blockTimestamp"])
         
-        print(f"\n⏳ Waiting 30 seconds before DA fetch...")
-        time.sleep(30)
-        
-        # Step 4: Attempt DA fetch
-        da_result = self.fetch_da_proof(voting_round_id, abi_encoded_request) 
+        # Step 4: Poll the DA layer until the proof lands
+        print(f"\n⏳ Polling DA layer for the proof...")
+        da_result = self._poll_da_proof(voting_round_id, abi_encoded_request)
         
         if da_result["success"]:
             print("🎉 COMPLETE SUCCESS! Full JsonApi attestation flow working!")
@@ -576,6 +877,53 @@ class FlareAttestationFlow:
             
         return True
 
+    # ------------------------------------------------------------------
+    # Async variants: thin asyncio.to_thread wrappers over the sync methods
+    # so N independent attestations can be driven with asyncio.gather while
+    # the blocking work (HTTP on the pooled session, web3 calls) runs in
+    # worker threads. aiohttp would add a second HTTP stack for the same
+    # overlap; to_thread reuses the session/retry setup above unchanged.
+    # ------------------------------------------------------------------
+
+    async def aprepare_evm_transaction_request(self, sepolia_tx_hash):
+        return await asyncio.to_thread(self.prepare_evm_transaction_request, sepolia_tx_hash)
+
+    async def asubmit_attestation_request(self, abi_encoded_request):
+        # One account, one nonce sequence: submissions must not interleave
+        async with self._submit_lock:
+            return await asyncio.to_thread(self.submit_attestation_request, abi_encoded_request)
+
+    async def afetch_da_proof(self, voting_round_id, abi_encoded_request):
+        return await asyncio.to_thread(self._poll_da_proof, voting_round_id, abi_encoded_request)
+
+    async def ademo_evm_transaction_flow(self, sepolia_tx_hash):
+        """Async demo_evm_transaction_flow for multi-tx workloads.
+
+        asyncio.gather across N hashes overlaps request preparation and the
+        long DA-proof polls between attestations; only the submit step is
+        serialized (nonce ordering), so total wall time approaches the
+        slowest attestation instead of the sum of all of them.
+        """
+        abi_encoded_request = await self.aprepare_evm_transaction_request(sepolia_tx_hash)
+        if not abi_encoded_request:
+            return False
+
+        result = await self.asubmit_attestation_request(abi_encoded_request)
+        if not result or not result["success"]:
+            return False
+
+        voting_round_id = self.compute_voting_round_id(result["blockTimestamp"])
+
+        print(f"\n⏳ Polling DA layer for the proof... ({sepolia_tx_hash[:10]}…)")
+        da_result = await self.afetch_da_proof(voting_round_id, abi_encoded_request)
+
+        if da_result["success"]:
+            print(f"🎉 COMPLETE SUCCESS! Full attestation flow working for {sepolia_tx_hash[:10]}…")
+        else:
+            print(f"⚠️  {sepolia_tx_hash[:10]}… submitted successfully, but DA proof not ready yet.")
+
+        return True
+
 def main():
     print("🚀 Flare FDC Corrected Implementation")
     print("Based on expert guidance to fix transaction reverts")
@@ -602,8 +950,20 @@ def main():
             print("❌ Missing sepolia transaction hash")
             return
         
-        sepolia_tx = sys.argv[2]
-        success = flow.demo_evm_transaction_flow(sepolia_tx)
+        # Several hashes fan out concurrently through the async variants;
+        # a single hash keeps the plain synchronous path
+        tx_hashes = sys.argv[2:]
+        if len(tx_hashes) > 1:
+            # asyncio.run needs a coroutine; gather outside a running loop
+            # returns a Future, so the fan-out lives in a wrapper coroutine
+            async def _run_all(hashes):
+                return await asyncio.gather(
+                    *[flow.ademo_evm_transaction_flow(tx) for tx in hashes]
+                )
+
+            success = all(asyncio.run(_run_all(tx_hashes)))
+        else:
+            success = flow.demo_evm_transaction_flow(tx_hashes[0])
         
     elif mode == "jsonapi":
         if len(sys.argv) < 5: